@@ -0,0 +1,56 @@
+# ==========================================================
+# Fixtures compartilhadas pelos testes
+# ==========================================================
+
+import pytest
+
+import distribuicoes
+
+
+@pytest.fixture(autouse=True)
+def semente_fixa():
+    """Reinicia o LCG global para que cada teste seja determinístico."""
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    yield
+
+
+@pytest.fixture
+def param():
+    """Parâmetros do Cenário 1 (Edifício)."""
+    return {
+        "prep": {"o":10, "m":14, "p":20, "muM":120000, "sigmaM":30000, "muL":150000, "sigmaL":35000},
+        "fundacaoA": {
+            "duracao": (30, 40, 55),
+            "custos": (2700000, 300000, 2300000, 250000)
+        },
+        "fundacaoB": {
+            "duracao": (25, 34, 48),
+            "custos": (3000000, 350000, 2100000, 260000)
+        },
+        "fundacao": {"pA":0.6, "pG":0.18, "Tgeo":25, "Cgeo":700000},
+        "laje": {"o":80, "m":100, "p":130, "muM":2400000, "sigmaM":300000, "muL":1800000, "sigmaL":200000},
+        "alvenaria": {"o":60, "m":75, "p":95, "muM":900000, "sigmaM":120000, "muL":1600000, "sigmaL":200000,
+                      "pR":0.12, "Cretrabalho":300000, "Tretrabalho":12},
+        "acab": {"o":80, "m":110, "p":150, "muM":2500000, "sigmaM":350000, "muL":2500000, "sigmaL":400000},
+        "pintura": {"pEP":0.6, "pW":0.2},
+        "pinturaA": {
+            "custos": (300000, 50000, 280000, 40000),
+            "dur_bom": (12, 16, 22),
+            "dur_chuva": (16, 20, 28)
+        },
+        "pinturaB": {
+            "custos": (320000, 60000, 260000, 45000),
+            "dur_bom": (10, 14, 18),
+            "dur_chuva": (14, 18, 24)
+        }
+    }
+
+
+@pytest.fixture
+def contrato():
+    """Contrato do Cenário 1 (Edifício)."""
+    return {
+        "valor_contrato": 19000000,
+        "prazo": 360,
+        "multa_dia": 3000
+    }
@@ -66,7 +66,7 @@ def simular_fundacao(
 def simular_laje(o3, m3, p3, muM3, sigmaM3, muL3, sigmaL3):
     """Simula a fase da laje."""
     T3 = rand_pert(o3, m3, p3)  # duração da fase
-    mu_ln_M3, sigma_ln_M3 = converter_lognormal(muL3, sigmaL3)  # converte parâmetros da LogNormal
+    mu_ln_M3, sigma_ln_M3 = converter_lognormal(muM3, sigmaM3)  # converte parâmetros da LogNormal
     CM3 = rand_lognormal(mu_ln_M3, sigma_ln_M3)  # custo de material da fase
     CMO3 = rand_normal(muL3, sigmaL3)  # custo de mão de obra da fase
 
@@ -80,9 +80,9 @@ def simular_laje(o3, m3, p3, muM3, sigmaM3, muL3, sigmaL3):
 def simular_alvenaria(o4, m4, p4, muM4, sigmaM4, muL4, sigmaL4, pR, C_retrabalho, T_retrabalho):
     """Simula a fase de alvenaria (com risco de retrabalho)."""
     T4 = rand_pert(o4, m4, p4)  # duração da fase
-    mu_ln, sigma_ln = converter_lognormal(muL4, sigmaL4)  # converte parâmetros da LogNormal
+    mu_ln, sigma_ln = converter_lognormal(muM4, sigmaM4)  # converte parâmetros da LogNormal
     CM4 = rand_lognormal(mu_ln, sigma_ln)  # custo de material da fase
-    CMO4 = rand_normal(muM4, sigmaM4)  # custo de mão de obra da fase
+    CMO4 = rand_normal(muL4, sigmaL4)  # custo de mão de obra da fase
 
     # Sorteia evento de retrabalho
     R = rand_bernoulli(pR)
@@ -147,4 +147,146 @@ def simular_pintura(
 
     T_total = T6
     C_total = CM6 + CMO6
-    return T_total, C_total
\ No newline at end of file
+    return T_total, C_total
+
+
+# ==========================================================
+# Modelos das fases para avaliação em lote (sensibilidade.py)
+# ==========================================================
+# modelo_<fase> recebe os mesmos argumentos de simular_<fase> e retorna
+# (fatores, compor):
+# - fatores: {fator: (grupo, gerador, argumentos)}, um fator aleatório por
+#   sorteio possível da fase (todos os ramos), com o grupo de entrada a que
+#   pertence (p. ex. "T" para a duração, "C" para o custo, "pG" para o
+#   evento geológico);
+# - compor(x): combina os valores sorteados de todos os fatores, escalares
+#   ou arrays, em (T, C) com as mesmas regras de simular_<fase>.
+# Os modelos não são usados por simular_<fase>: são montados uma vez por
+# conjunto de parâmetros e sorteados em lote.
+# ==========================================================
+def sortear_custo(mu_ln, sigma_ln, muL, sigmaL):
+    """Custo de material (LogNormal) + mão de obra (Normal) de uma fase."""
+    CM = rand_lognormal(mu_ln, sigma_ln)  # custo de material da fase
+    CMO = rand_normal(muL, sigmaL)  # custo de mão de obra da fase
+    return CM + CMO
+
+
+def fator_custo(muM, sigmaM, muL, sigmaL):
+    """Fator de custo do grupo "C", com os parâmetros da LogNormal já convertidos."""
+    return ("C", sortear_custo, (*converter_lognormal(muM, sigmaM), muL, sigmaL))
+
+
+def escolher(evento, a, b):
+    """Valor de `a` se o evento (0/1) ocorreu, senão de `b` (exato: 1*a + 0*b == a)."""
+    return evento * a + (1 - evento) * b
+
+
+def _compor_simples(x):
+    """Fase sem eventos: a duração e o custo vêm direto dos fatores."""
+    return x["T"], x["C"]
+
+
+def modelo_preparacao(o1, m1, p1, muM1, sigmaM1, muL1, sigmaL1):
+    """Modelo em lote da preparação do terreno: (fatores T e C, compor)."""
+    fatores = {
+        "T": ("T", rand_pert, (o1, m1, p1)),
+        "C": fator_custo(muM1, sigmaM1, muL1, sigmaL1),
+    }
+    return fatores, _compor_simples
+
+
+def modelo_fundacao(
+    oA, mA, pA, muMA, sigmaMA, muLA, sigmaLA,
+    oB, mB, pB, muMB, sigmaMB, muLB, sigmaLB,
+    probA, probGeo, T_geo, C_geo
+):
+    """Modelo em lote da fundação: (fatores EF, TA/CA, TB/CB e G, compor)."""
+    fatores = {
+        "EF": ("pA", rand_bernoulli, (probA,)),  # escolha da empresa
+        "TA": ("T", rand_pert, (oA, mA, pA)),
+        "CA": fator_custo(muMA, sigmaMA, muLA, sigmaLA),
+        "TB": ("T", rand_pert, (oB, mB, pB)),
+        "CB": fator_custo(muMB, sigmaMB, muLB, sigmaLB),
+        "G": ("pG", rand_bernoulli, (probGeo,)),  # evento geológico
+    }
+
+    def compor(x):
+        T2 = escolher(x["EF"], x["TA"], x["TB"])
+        C2 = escolher(x["EF"], x["CA"], x["CB"])
+        return T2 + x["G"] * T_geo, C2 + x["G"] * C_geo
+
+    return fatores, compor
+
+
+def modelo_laje(o3, m3, p3, muM3, sigmaM3, muL3, sigmaL3):
+    """Modelo em lote da laje: (fatores T e C, compor)."""
+    fatores = {
+        "T": ("T", rand_pert, (o3, m3, p3)),
+        "C": fator_custo(muM3, sigmaM3, muL3, sigmaL3),
+    }
+    return fatores, _compor_simples
+
+
+def modelo_alvenaria(o4, m4, p4, muM4, sigmaM4, muL4, sigmaL4, pR, C_retrabalho, T_retrabalho):
+    """Modelo em lote da alvenaria: (fatores T, C e R, compor)."""
+    fatores = {
+        "T": ("T", rand_pert, (o4, m4, p4)),
+        "C": fator_custo(muM4, sigmaM4, muL4, sigmaL4),
+        "R": ("pR", rand_bernoulli, (pR,)),  # evento de retrabalho
+    }
+
+    def compor(x):
+        return x["T"] + x["R"] * T_retrabalho, x["C"] + x["R"] * C_retrabalho
+
+    return fatores, compor
+
+
+def modelo_acabamento(o5, m5, p5, muM5, sigmaM5, muL5, sigmaL5):
+    """Modelo em lote do acabamento interno: (fatores T e C, compor)."""
+    fatores = {
+        "T": ("T", rand_pert, (o5, m5, p5)),
+        "C": fator_custo(muM5, sigmaM5, muL5, sigmaL5),
+    }
+    return fatores, _compor_simples
+
+
+def modelo_pintura(
+    pEP, pW,
+    # Empresa A
+    muMA, sigmaMA, muLA, sigmaLA,
+    oA_bom, mA_bom, pA_bom,
+    oA_chuva, mA_chuva, pA_chuva,
+    # Empresa B
+    muMB, sigmaMB, muLB, sigmaLB,
+    oB_bom, mB_bom, pB_bom,
+    oB_chuva, mB_chuva, pB_chuva
+):
+    """Modelo em lote da pintura externa: (fatores EP, W, CA/TA_* e CB/TB_*, compor)."""
+    fatores = {
+        "EP": ("pEP", rand_bernoulli, (pEP,)),  # escolha da empresa
+        "W": ("pW", rand_bernoulli, (pW,)),  # condição climática
+        "CA": fator_custo(muMA, sigmaMA, muLA, sigmaLA),
+        "TA_bom": ("T", rand_pert, (oA_bom, mA_bom, pA_bom)),
+        "TA_chuva": ("T", rand_pert, (oA_chuva, mA_chuva, pA_chuva)),
+        "CB": fator_custo(muMB, sigmaMB, muLB, sigmaLB),
+        "TB_bom": ("T", rand_pert, (oB_bom, mB_bom, pB_bom)),
+        "TB_chuva": ("T", rand_pert, (oB_chuva, mB_chuva, pB_chuva)),
+    }
+
+    def compor(x):
+        TA = escolher(x["W"], x["TA_chuva"], x["TA_bom"])
+        TB = escolher(x["W"], x["TB_chuva"], x["TB_bom"])
+        return escolher(x["EP"], TA, TB), escolher(x["EP"], x["CA"], x["CB"])
+
+    return fatores, compor
+
+
+# Modelo em lote de cada simulador de fase
+MODELOS = {
+    simular_preparacao: modelo_preparacao,
+    simular_fundacao: modelo_fundacao,
+    simular_laje: modelo_laje,
+    simular_alvenaria: modelo_alvenaria,
+    simular_acabamento: modelo_acabamento,
+    simular_pintura: modelo_pintura,
+}
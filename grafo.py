@@ -0,0 +1,152 @@
+# ==========================================================
+# MÓDULO: grafo.py
+# Grafo de precedência das fases e caminho crítico vetorizado
+# ==========================================================
+# Depende de: numpy (simuladores no estilo de fases.py)
+# ==========================================================
+
+import numpy as np
+
+
+class GrafoFases:
+    """
+    Grafo declarativo de fases do projeto.
+
+    Cada fase aponta para um simulador no estilo de fases.py, isto é,
+    uma função que retorna (tempo, custo), e declara as fases que
+    precisam terminar antes de ela começar. As fases podem ser adicionadas
+    em qualquer ordem: a ordem de inserção define apenas a ordem de
+    sorteio, e o caminho crítico segue uma ordem topológica do grafo.
+    """
+
+    def __init__(self):
+        self.nomes = []
+        self.simuladores = []
+        self.argumentos = []
+        self.predecessoras = []  # nomes das predecessoras de cada fase
+
+    def adicionar(self, nome, simulador, args=(), predecessoras=()):
+        """Adiciona uma fase que começa após o término de todas as predecessoras."""
+        if nome in self.nomes:
+            raise ValueError(f"Fase '{nome}' já existe no grafo.")
+
+        self.nomes.append(nome)
+        self.simuladores.append(simulador)
+        self.argumentos.append(tuple(args))
+        self.predecessoras.append(list(predecessoras))
+
+    def ordem_topologica(self):
+        """
+        Ordena as fases de modo que cada uma venha depois de suas predecessoras
+        (algoritmo de Kahn, estável em relação à ordem de inserção).
+        Retorna (ordem, preds): os índices das fases e, para cada fase, os
+        índices de suas predecessoras.
+        """
+        preds = []
+        for nome, nomes_preds in zip(self.nomes, self.predecessoras):
+            for p in nomes_preds:
+                if p not in self.nomes:
+                    raise ValueError(f"Predecessora '{p}' de '{nome}' não existe no grafo.")
+            preds.append([self.nomes.index(p) for p in nomes_preds])
+
+        pendentes = [len(set(p)) for p in preds]
+        sucessoras = [[] for _ in self.nomes]
+        for j, ps in enumerate(preds):
+            for p in set(ps):
+                sucessoras[p].append(j)
+
+        prontas = [j for j, n in enumerate(pendentes) if n == 0]
+        ordem = []
+        while prontas:
+            j = prontas.pop(0)
+            ordem.append(j)
+            for s in sucessoras[j]:
+                pendentes[s] -= 1
+                if pendentes[s] == 0:
+                    prontas.append(s)
+                    prontas.sort()
+
+        if len(ordem) < len(self.nomes):
+            ciclo = [self.nomes[j] for j in range(len(self.nomes)) if j not in ordem]
+            raise ValueError(f"Precedências com ciclo entre as fases: {', '.join(ciclo)}.")
+        return ordem, preds
+
+    # ------------------------------------------------------
+    # Amostragem em lote
+    # ------------------------------------------------------
+    def amostrar(self, N):
+        """
+        Executa N iterações de todas as fases.
+        Retorna as matrizes T e C com forma (n_fases, N), na ordem de inserção.
+        Dentro de cada iteração as fases são sorteadas na ordem do grafo,
+        reproduzindo a sequência de números de simular_projeto.
+        """
+        T = np.empty((len(self.nomes), N))
+        C = np.empty((len(self.nomes), N))
+        fases = list(enumerate(zip(self.simuladores, self.argumentos)))
+        for i in range(N):
+            for j, (simulador, args) in fases:
+                T[j, i], C[j, i] = simulador(*args)
+        return T, C
+
+    # ------------------------------------------------------
+    # Caminho crítico
+    # ------------------------------------------------------
+    def caminho_critico(self, T):
+        """
+        Calcula a duração do projeto (caminho mais longo) para cada amostra.
+        Retorna (duracao, criticas), onde criticas[j, i] indica se a fase j
+        está no caminho crítico da amostra i.
+        """
+        n, N = T.shape
+        ordem, predecessoras = self.ordem_topologica()
+        colunas = np.arange(N)
+        fim = np.empty_like(T)
+        escolhida = [None] * n  # predecessora que define o início, por amostra
+
+        # Passo direto: término = max(término das predecessoras) + duração
+        for j in ordem:
+            preds = predecessoras[j]
+            if not preds:
+                fim[j] = T[j]
+            elif len(preds) == 1:
+                fim[j] = fim[preds[0]] + T[j]
+                escolhida[j] = np.zeros(N, dtype=np.intp)
+            else:
+                fins = fim[preds]
+                escolhida[j] = fins.argmax(axis=0)
+                fim[j] = fins[escolhida[j], colunas] + T[j]
+
+        # A fase terminal que acaba por último fecha o projeto
+        sucessoras = {p for preds in predecessoras for p in preds}
+        terminais = [j for j in range(n) if j not in sucessoras]
+        fins = fim[terminais]
+        ultima = fins.argmax(axis=0)
+        duracao = fins[ultima, colunas]
+
+        # Passo reverso: volta pelas predecessoras escolhidas no passo direto
+        criticas = np.zeros((n, N), dtype=bool)
+        for k, j in enumerate(terminais):
+            criticas[j] = ultima == k
+        for j in reversed(ordem):
+            for k, p in enumerate(predecessoras[j]):
+                criticas[p] |= criticas[j] & (escolhida[j] == k)
+
+        return duracao, criticas
+
+    def simular(self, N):
+        """
+        Executa N simulações do grafo.
+        Retorna (tempos, custos, criticidade), onde criticidade é a fração
+        das simulações em que cada fase esteve no caminho crítico.
+        """
+        T, C = self.amostrar(N)
+        tempos, criticas = self.caminho_critico(T)
+
+        # Soma na ordem das fases, como em simular_projeto
+        custos = C[0].copy()
+        for linha in C[1:]:
+            custos += linha
+
+        criticidade = dict(zip(self.nomes, criticas.mean(axis=1)))
+        return tempos, custos, criticidade
@@ -0,0 +1,186 @@
+# ==========================================================
+# MÓDULO: sensibilidade.py
+# Análise de sensibilidade: índices de Sobol e gráfico tornado
+# ==========================================================
+# Depende de: fases.py, grafo.py e simulator.py
+# ==========================================================
+#
+# Cada entrada de interesse (escolha da empresa, risco geológico,
+# retrabalho, chuva, duração e custo de cada fase...) é um grupo de
+# fatores aleatórios sorteados em lote. O modelo é avaliado de forma
+# vetorizada sobre esses fatores, reaproveitando o caminho crítico do
+# grafo de fases. No desenho de Saltelli, as matrizes A e B são sorteadas
+# uma única vez e cada grupo só troca as próprias colunas, de modo que o
+# custo cresce linearmente com o número de grupos: N * (grupos + 2).
+# ==========================================================
+
+import numpy as np
+
+from fases import MODELOS
+from simulator import fases_do_projeto, montar_grafo
+
+
+# ==========================================================
+# 1. Entradas do modelo
+# ==========================================================
+def modelos_do_projeto(param):
+    """Retorna {fase: (fatores, compor)} a partir dos modelos de fases.py."""
+    return {
+        nome: MODELOS[simulador](*args)
+        for nome, simulador, args in fases_do_projeto(param)
+    }
+
+
+def grupos_de_entrada(modelos):
+    """
+    Agrupa os fatores aleatórios das fases pelo grupo declarado em fases.py
+    (p. ex. "fundacao.pG", "acab.T"). Retorna {grupo: {fator: (gerador, argumentos)}}.
+    """
+    grupos = {}
+    for fase, (fatores, _) in modelos.items():
+        for fator, (grupo, gerador, args) in fatores.items():
+            grupos.setdefault(f"{fase}.{grupo}", {})[fator] = (gerador, args)
+    return grupos
+
+
+def sortear_entradas(grupos, N):
+    """Sorteia N valores de cada fator. Retorna {grupo: {fator: array}}."""
+    return {
+        grupo: {
+            fator: np.array([gerador(*args) for _ in range(N)])
+            for fator, (gerador, args) in fatores.items()
+        }
+        for grupo, fatores in grupos.items()
+    }
+
+
+# ==========================================================
+# 2. Modelo vetorizado
+# ==========================================================
+def avaliar_modelo(x, modelos, contrato, grafo):
+    """
+    Avalia o projeto para todas as amostras dos fatores `x` de uma vez,
+    aplicando as regras de composição dos `modelos` (ver modelos_do_projeto).
+    Retorna {"prejuizo": indicador 0/1, "custo": custo com multa, "tempo": duração}.
+    """
+    valores = {}
+    for grupo, fatores in x.items():
+        valores.setdefault(grupo.split(".")[0], {}).update(fatores)
+
+    fases = {nome: compor(valores[nome]) for nome, (_, compor) in modelos.items()}
+
+    T = np.array([fases[nome][0] for nome in grafo.nomes], dtype=float)
+    tempo, _ = grafo.caminho_critico(T)
+    custo = sum(fases[nome][1] for nome in grafo.nomes)
+
+    multa = np.maximum(0, tempo - contrato['prazo']) * contrato['multa_dia']
+    custo = custo + multa
+    prejuizo = (custo > contrato['valor_contrato']).astype(float)
+    return {"prejuizo": prejuizo, "custo": custo, "tempo": tempo}
+
+
+# ==========================================================
+# 3. Índices de Sobol (desenho de Saltelli)
+# ==========================================================
+def indices_sobol(A, B, modelo):
+    """
+    Estima os índices de Sobol de primeira ordem (Saltelli, 2010) e totais
+    (Jansen) de cada grupo. `A` e `B` são amostras independentes no formato
+    de sortear_entradas; `modelo` recebe uma amostra e devolve {saida: array}.
+    Retorna {saida: {grupo: {"S1": ..., "ST": ...}}}.
+    """
+    yA, yB = modelo(A), modelo(B)
+
+    # Centrar as saídas reduz a variância do estimador de primeira ordem
+    medias, variancias = {}, {}
+    for saida in yA:
+        y = np.concatenate([yA[saida], yB[saida]])
+        medias[saida], variancias[saida] = y.mean(), y.var()
+        yA[saida] = yA[saida] - medias[saida]
+        yB[saida] = yB[saida] - medias[saida]
+
+    indices = {saida: {} for saida in yA}
+    for grupo in A:
+        AB = dict(A)
+        AB[grupo] = B[grupo]  # só as colunas do grupo vêm de B
+        yAB = modelo(AB)
+
+        for saida, V in variancias.items():
+            if V == 0:
+                indices[saida][grupo] = {"S1": 0.0, "ST": 0.0}
+                continue
+            y = yAB[saida] - medias[saida]
+            S1 = np.mean(yB[saida] * (y - yA[saida])) / V
+            ST = 0.5 * np.mean((yA[saida] - y) ** 2) / V
+            indices[saida][grupo] = {"S1": S1, "ST": ST}
+
+    return indices
+
+
+# ==========================================================
+# 4. Tornado
+# ==========================================================
+def _fixar(fatores, q):
+    """Fixa cada fator do grupo no quantil q (eventos 0/1 vão para 0 ou 1)."""
+    fixados = {}
+    for fator, valores in fatores.items():
+        if valores.dtype.kind in "iub":
+            valor = 1 if q >= 0.5 else 0
+        else:
+            valor = np.quantile(valores, q)
+        fixados[fator] = np.full(len(valores), valor, dtype=valores.dtype)
+    return fixados
+
+
+def faixas_tornado(A, modelo, quantis=(0.1, 0.9)):
+    """
+    Para cada grupo, fixa seus fatores no quantil baixo e alto (os demais
+    seguem a amostra A) e mede a média de cada saída.
+    Retorna (base, faixas): base = {saida: média com A} e
+    faixas = {saida: [(grupo, baixo, alto), ...]} ordenadas pela amplitude.
+    """
+    yA = modelo(A)
+    base = {saida: valores.mean() for saida, valores in yA.items()}
+    faixas = {saida: [] for saida in yA}
+
+    for grupo, fatores in A.items():
+        medias = []
+        for q in quantis:
+            AQ = dict(A)
+            AQ[grupo] = _fixar(fatores, q)
+            medias.append({saida: valores.mean() for saida, valores in modelo(AQ).items()})
+        for saida in yA:
+            faixas[saida].append((grupo, medias[0][saida], medias[1][saida]))
+
+    for saida in faixas:
+        faixas[saida].sort(key=lambda f: abs(f[2] - f[1]), reverse=True)
+    return base, faixas
+
+
+# ==========================================================
+# 5. Análise completa
+# ==========================================================
+def analisar_sensibilidade(param, contrato, N=10000, precedencias=None, quantis=(0.1, 0.9)):
+    """
+    Executa a análise de sensibilidade do projeto para probabilidade de
+    prejuízo, custo total (com multa) e tempo total.
+    Sorteia 2N amostras de cada fator uma única vez e as reutiliza
+    tanto nos índices de Sobol quanto no tornado.
+    """
+    grafo = montar_grafo(param, precedencias)
+    modelos = modelos_do_projeto(param)
+
+    def modelo(x):
+        return avaliar_modelo(x, modelos, contrato, grafo)
+
+    amostras = sortear_entradas(grupos_de_entrada(modelos), 2 * N)
+    A = {g: {f: v[:N] for f, v in fatores.items()} for g, fatores in amostras.items()}
+    B = {g: {f: v[N:] for f, v in fatores.items()} for g, fatores in amostras.items()}
+
+    base, tornado = faixas_tornado(A, modelo, quantis)
+    return {
+        "sobol": indices_sobol(A, B, modelo),
+        "base": base,
+        "tornado": tornado,
+    }
+
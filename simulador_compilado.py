@@ -0,0 +1,253 @@
+# ==========================================================
+# MÓDULO: simulador_compilado.py
+# Núcleo compilado (Numba) da simulação completa do projeto
+# ==========================================================
+# Depende de: distribuicoes.py e numpy (Numba opcional)
+# ==========================================================
+#
+# Funde em um único laço tudo o que simular_projeto faz por iteração:
+# LCG, Box-Muller, Marsaglia & Tsang, Beta/PERT, ramificações das fases
+# e multa contratual. Os parâmetros são pré-compilados em um vetor plano
+# e cada operação repete exatamente a ordem e a aritmética de
+# distribuicoes.py e fases.py, de modo que a sequência de números (e o
+# resultado de cada simulação) é idêntica à do motor em Python puro.
+#
+# Sem Numba instalado, as mesmas funções rodam como Python comum.
+# ==========================================================
+
+import math
+
+import numpy as np
+
+import distribuicoes
+from distribuicoes import converter_lognormal
+
+try:
+    from numba import njit
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
+    def njit(*args, **kwargs):
+        """Substituto sem compilação: devolve a própria função."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funcao: funcao
+
+# Constantes do LCG (as mesmas de distribuicoes.LCG)
+_A = distribuicoes.lcg.a
+_C = distribuicoes.lcg.c
+_M = distribuicoes.lcg.m
+
+
+# ==========================================================
+# 1. Pré-compilação dos parâmetros
+# ==========================================================
+# Blocos do vetor de parâmetros:
+#   PERT  (4): o, p - o, α, β
+#   custo (4): μ_ln, σ_ln (material), μ, σ (mão de obra)
+#   fase simples (8): PERT + custo
+P_PREP = 0
+P_FUND_A_T, P_FUND_A_C, P_FUND_B_T, P_FUND_B_C = 8, 12, 16, 20
+P_FUND_PA, P_FUND_PG, P_FUND_TGEO, P_FUND_CGEO = 24, 25, 26, 27
+P_LAJE = 28
+P_ALV, P_ALV_PR, P_ALV_CRET, P_ALV_TRET = 36, 44, 45, 46
+P_ACAB = 47
+P_PINT_PEP, P_PINT_PW = 55, 56
+P_PINT_A_C, P_PINT_A_BOM, P_PINT_A_CHUVA = 57, 61, 65
+P_PINT_B_C, P_PINT_B_BOM, P_PINT_B_CHUVA = 69, 73, 77
+P_PRAZO, P_MULTA = 81, 82
+N_PARAMETROS = 83
+
+# Expoentes do Marsaglia & Tsang, passados ao núcleo em tempo de execução:
+# com constantes no código o Numba troca pow(x, 2) e pow(x, 3) por
+# multiplicações, que arredondam diferente de `x ** 2` no CPython
+_EXPOENTES = np.array([2.0, 3.0])
+
+
+def _bloco_pert(o, m, p):
+    """Parâmetros da PERT calculados como em rand_pert."""
+    if not (o < m < p):
+        raise ValueError("Deve-se ter o < m < p.")
+    alpha = 1 + 4 * (m - o) / (p - o)
+    beta = 1 + 4 * (p - m) / (p - o)
+    return [o, p - o, alpha, beta]
+
+
+def _bloco_custo(muM, sigmaM, muL, sigmaL):
+    """Parâmetros de material (LogNormal convertida) e mão de obra (Normal)."""
+    return [*converter_lognormal(muM, sigmaM), muL, sigmaL]
+
+
+def _bloco_fase(p):
+    return _bloco_pert(p['o'], p['m'], p['p']) + _bloco_custo(p['muM'], p['sigmaM'], p['muL'], p['sigmaL'])
+
+
+def compilar_parametros(param, contrato):
+    """Converte os dicionários de parâmetros e contrato no vetor plano do núcleo."""
+    fund, alv = param['fundacao'], param['alvenaria']
+    pA, pB = param['pinturaA'], param['pinturaB']
+    params = (
+        _bloco_fase(param['prep'])
+        + _bloco_pert(*param['fundacaoA']['duracao']) + _bloco_custo(*param['fundacaoA']['custos'])
+        + _bloco_pert(*param['fundacaoB']['duracao']) + _bloco_custo(*param['fundacaoB']['custos'])
+        + [fund['pA'], fund['pG'], fund['Tgeo'], fund['Cgeo']]
+        + _bloco_fase(param['laje'])
+        + _bloco_fase(alv) + [alv['pR'], alv['Cretrabalho'], alv['Tretrabalho']]
+        + _bloco_fase(param['acab'])
+        + [param['pintura']['pEP'], param['pintura']['pW']]
+        + _bloco_custo(*pA['custos']) + _bloco_pert(*pA['dur_bom']) + _bloco_pert(*pA['dur_chuva'])
+        + _bloco_custo(*pB['custos']) + _bloco_pert(*pB['dur_bom']) + _bloco_pert(*pB['dur_chuva'])
+        + [contrato['prazo'], contrato['multa_dia']]
+    )
+    assert len(params) == N_PARAMETROS
+    return np.array(params, dtype=np.float64)
+
+
+# ==========================================================
+# 2. Geradores (estado do LCG passado e devolvido explicitamente)
+# ==========================================================
+@njit(cache=True)
+def _uniforme(X):
+    X = (_A * X + _C) % _M
+    return X, X / _M
+
+
+@njit(cache=True)
+def _bernoulli(X, p):
+    X, u = _uniforme(X)
+    return X, 1 if u < p else 0
+
+
+@njit(cache=True)
+def _normal(X, mu, sigma):
+    X, u1 = _uniforme(X)
+    X, u2 = _uniforme(X)
+    z = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
+    return X, mu + sigma * z
+
+
+@njit(cache=True)
+def _gamma(X, k, expoentes):
+    if k < 1:
+        b = (math.e + k) / math.e
+        while True:
+            X, u = _uniforme(X)
+            p = b * u
+            if p <= 1:
+                x = p ** (1 / k)
+            else:
+                x = -math.log((b - p) / k)
+            X, u2 = _uniforme(X)
+            if p <= 1:
+                if u2 <= math.exp(-x):
+                    return X, x
+            else:
+                if u2 <= x ** (k - 1):
+                    return X, x
+    else:
+        d = k - 1 / 3
+        c = 1 / math.sqrt(9 * d)
+        while True:
+            X, z = _normal(X, 0.0, 1.0)
+            X, u = _uniforme(X)
+            v = (1 + c * z) ** expoentes[1]
+            if v > 0 and math.log(u) < 0.5 * z ** expoentes[0] + d - d * v + d * math.log(v):
+                return X, d * v
+
+
+@njit(cache=True)
+def _pert(X, params, i, expoentes):
+    X, g1 = _gamma(X, params[i + 2], expoentes)
+    X, g2 = _gamma(X, params[i + 3], expoentes)
+    return X, params[i] + params[i + 1] * (g1 / (g1 + g2))
+
+
+@njit(cache=True)
+def _custo(X, params, i):
+    X, x = _normal(X, params[i], params[i + 1])
+    CM = math.exp(x)
+    X, CMO = _normal(X, params[i + 2], params[i + 3])
+    return X, CM + CMO
+
+
+# ==========================================================
+# 3. Laço fundido
+# ==========================================================
+@njit(cache=True)
+def _simular_lote(params, expoentes, N, X):
+    """Executa N iterações completas; devolve (tempos, custos com multa, multas, X)."""
+    tempos = np.empty(N)
+    custos = np.empty(N)
+    multas = np.empty(N)
+
+    for it in range(N):
+        # Preparação do terreno
+        X, T1 = _pert(X, params, P_PREP, expoentes)
+        X, C1 = _custo(X, params, P_PREP + 4)
+
+        # Fundação (empresa A/B + risco geológico)
+        X, EF = _bernoulli(X, params[P_FUND_PA])
+        if EF == 1:
+            X, T2 = _pert(X, params, P_FUND_A_T, expoentes)
+            X, C2 = _custo(X, params, P_FUND_A_C)
+        else:
+            X, T2 = _pert(X, params, P_FUND_B_T, expoentes)
+            X, C2 = _custo(X, params, P_FUND_B_C)
+        X, G = _bernoulli(X, params[P_FUND_PG])
+        if G == 1:
+            T2 = T2 + params[P_FUND_TGEO]
+            C2 = C2 + params[P_FUND_CGEO]
+
+        # Laje
+        X, T3 = _pert(X, params, P_LAJE, expoentes)
+        X, C3 = _custo(X, params, P_LAJE + 4)
+
+        # Alvenaria (risco de retrabalho)
+        X, T4 = _pert(X, params, P_ALV, expoentes)
+        X, C4 = _custo(X, params, P_ALV + 4)
+        X, R = _bernoulli(X, params[P_ALV_PR])
+        if R == 1:
+            T4 = T4 + params[P_ALV_TRET]
+            C4 = C4 + params[P_ALV_CRET]
+
+        # Acabamento interno
+        X, T5 = _pert(X, params, P_ACAB, expoentes)
+        X, C5 = _custo(X, params, P_ACAB + 4)
+
+        # Pintura externa (empresa A/B + chuva)
+        X, EP = _bernoulli(X, params[P_PINT_PEP])
+        X, W = _bernoulli(X, params[P_PINT_PW])
+        if EP == 1:
+            X, C6 = _custo(X, params, P_PINT_A_C)
+            X, T6 = _pert(X, params, P_PINT_A_CHUVA if W == 1 else P_PINT_A_BOM, expoentes)
+        else:
+            X, C6 = _custo(X, params, P_PINT_B_C)
+            X, T6 = _pert(X, params, P_PINT_B_CHUVA if W == 1 else P_PINT_B_BOM, expoentes)
+
+        # Soma total e multa contratual
+        tempo = T1 + T2 + T3 + T4 + T5 + T6
+        custo = C1 + C2 + C3 + C4 + C5 + C6
+        multa = max(0.0, tempo - params[P_PRAZO]) * params[P_MULTA]
+
+        tempos[it] = tempo
+        custos[it] = custo + multa
+        multas[it] = multa
+
+    return tempos, custos, multas, X
+
+
+def simular_lote_compilado(param, contrato, N):
+    """
+    Executa N simulações no núcleo fundido, continuando a sequência do LCG
+    global de distribuicoes.py (que é avançado ao final, como no motor puro).
+    Retorna (tempos, custos com multa, multas).
+    """
+    params = compilar_parametros(param, contrato)
+    expoentes = _EXPOENTES
+    if not NUMBA_DISPONIVEL:
+        # floats nativos são mais rápidos em Python puro
+        params, expoentes = params.tolist(), expoentes.tolist()
+    tempos, custos, multas, X = _simular_lote(params, expoentes, N, distribuicoes.lcg.X)
+    distribuicoes.lcg.X = int(X)
+    return tempos, custos, multas
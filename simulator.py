@@ -12,171 +12,242 @@ from fases import (
     simular_preparacao, simular_fundacao, simular_laje,
     simular_alvenaria, simular_acabamento, simular_pintura
 )
-from distribuicoes import converter_lognormal
-import statistics
+from grafo import GrafoFases
+from simulador_compilado import simular_lote_compilado
+import numpy as np
+import math
 
 
 # ==========================================================
 # 1. Simular uma obra completa
 # ==========================================================
+def fases_do_projeto(param):
+    """Retorna a lista (nome, simulador, argumentos) de cada fase do projeto."""
+    return [
+        # ----------------------------
+        # Preparação do terreno
+        # ----------------------------
+        ("prep", simular_preparacao, (
+            param['prep']['o'], param['prep']['m'], param['prep']['p'],
+            param['prep']['muM'], param['prep']['sigmaM'],
+            param['prep']['muL'], param['prep']['sigmaL']
+        )),
+
+        # ----------------------------
+        # Fundação
+        # ----------------------------
+        ("fundacao", simular_fundacao, (
+            *param['fundacaoA']['duracao'],
+            *param['fundacaoA']['custos'],
+            *param['fundacaoB']['duracao'],
+            *param['fundacaoB']['custos'],
+            param['fundacao']['pA'],
+            param['fundacao']['pG'],
+            param['fundacao']['Tgeo'],
+            param['fundacao']['Cgeo']
+        )),
+
+        # ----------------------------
+        # Laje
+        # ----------------------------
+        ("laje", simular_laje, (
+            param['laje']['o'], param['laje']['m'], param['laje']['p'],
+            param['laje']['muM'], param['laje']['sigmaM'],
+            param['laje']['muL'], param['laje']['sigmaL']
+        )),
+
+        # ----------------------------
+        # Alvenaria
+        # ----------------------------
+        ("alvenaria", simular_alvenaria, (
+            param['alvenaria']['o'], param['alvenaria']['m'], param['alvenaria']['p'],
+            param['alvenaria']['muM'], param['alvenaria']['sigmaM'],
+            param['alvenaria']['muL'], param['alvenaria']['sigmaL'],
+            param['alvenaria']['pR'], param['alvenaria']['Cretrabalho'],
+            param['alvenaria']['Tretrabalho']
+        )),
+
+        # ----------------------------
+        # Acabamento
+        # ----------------------------
+        ("acab", simular_acabamento, (
+            param['acab']['o'], param['acab']['m'], param['acab']['p'],
+            param['acab']['muM'], param['acab']['sigmaM'],
+            param['acab']['muL'], param['acab']['sigmaL']
+        )),
+
+        # ----------------------------
+        # Pintura
+        # ----------------------------
+        ("pintura", simular_pintura, (
+            param['pintura']['pEP'], param['pintura']['pW'],
+            # Empresa A
+            *param['pinturaA']['custos'],
+            *param['pinturaA']['dur_bom'],
+            *param['pinturaA']['dur_chuva'],
+            # Empresa B
+            *param['pinturaB']['custos'],
+            *param['pinturaB']['dur_bom'],
+            *param['pinturaB']['dur_chuva'],
+        )),
+    ]
+
+
 def simular_projeto(param):
     """Executa uma simulação completa de todas as fases do projeto."""
-
-    # ----------------------------
-    # Preparação do terreno
-    # ----------------------------
-    T1, C1 = simular_preparacao(
-        param['prep']['o'], param['prep']['m'], param['prep']['p'],
-        param['prep']['muM'], param['prep']['sigmaM'],
-        param['prep']['muL'], param['prep']['sigmaL']
-    )
-
-    # ----------------------------
-    # Fundação
-    # ----------------------------
-    T2, C2 = simular_fundacao(
-        *param['fundacaoA']['duracao'],
-        *param['fundacaoA']['custos'],
-        *param['fundacaoB']['duracao'],
-        *param['fundacaoB']['custos'],
-        param['fundacao']['pA'],
-        param['fundacao']['pG'],
-        param['fundacao']['Tgeo'],
-        param['fundacao']['Cgeo']
-    )
-
-    # ----------------------------
-    # Laje
-    # ----------------------------
-    T3, C3 = simular_laje(
-        param['laje']['o'], param['laje']['m'], param['laje']['p'],
-        param['laje']['muM'], param['laje']['sigmaM'],
-        param['laje']['muL'], param['laje']['sigmaL']
-    )
-
-    # ----------------------------
-    # Alvenaria
-    # ----------------------------
-    T4, C4 = simular_alvenaria(
-        param['alvenaria']['o'], param['alvenaria']['m'], param['alvenaria']['p'],
-        param['alvenaria']['muM'], param['alvenaria']['sigmaM'],
-        param['alvenaria']['muL'], param['alvenaria']['sigmaL'],
-        param['alvenaria']['pR'], param['alvenaria']['Cretrabalho'],
-        param['alvenaria']['Tretrabalho']
-    )
-
-    # ----------------------------
-    # Acabamento
-    # ----------------------------
-    T5, C5 = simular_acabamento(
-        param['acab']['o'], param['acab']['m'], param['acab']['p'],
-        param['acab']['muM'], param['acab']['sigmaM'],
-        param['acab']['muL'], param['acab']['sigmaL']
-    )
-
-    # ----------------------------
-    # Pintura
-    # ----------------------------
-    T6, C6 = simular_pintura(
-        param['pintura']['pEP'], param['pintura']['pW'],
-        # Empresa A
-        *param['pinturaA']['custos'],
-        *param['pinturaA']['dur_bom'],
-        *param['pinturaA']['dur_chuva'],
-        # Empresa B
-        *param['pinturaB']['custos'],
-        *param['pinturaB']['dur_bom'],
-        *param['pinturaB']['dur_chuva'],
-    )
-
-    # ----------------------------
-    # Soma total
-    # ----------------------------
-    tempo_total = T1 + T2 + T3 + T4 + T5 + T6
-    custo_total = C1 + C2 + C3 + C4 + C5 + C6
+    tempo_total = 0
+    custo_total = 0
+    for _, simulador, args in fases_do_projeto(param):
+        T, C = simulador(*args)
+        tempo_total += T
+        custo_total += C
 
     return tempo_total, custo_total
 
 
+# Fases executadas em série: cada uma depende da anterior
+PRECEDENCIAS_PADRAO = {
+    "prep": (),
+    "fundacao": ("prep",),
+    "laje": ("fundacao",),
+    "alvenaria": ("laje",),
+    "acab": ("alvenaria",),
+    "pintura": ("acab",),
+}
+
+
+def montar_grafo(param, precedencias=None):
+    """
+    Monta o grafo de fases do projeto.
+    `precedencias` sobrescreve as dependências padrão de cada fase, p. ex.
+    {"pintura": ("alvenaria",)} executa a pintura externa em paralelo
+    ao acabamento interno. As fases são sorteadas sempre na ordem de
+    fases_do_projeto, qualquer que seja a ordem das precedências.
+    """
+    precedencias = precedencias or {}
+    desconhecidas = set(precedencias) - set(PRECEDENCIAS_PADRAO)
+    if desconhecidas:
+        raise ValueError(f"Fases desconhecidas em precedencias: {', '.join(sorted(desconhecidas))}.")
+
+    deps = dict(PRECEDENCIAS_PADRAO)
+    deps.update(precedencias)
+
+    grafo = GrafoFases()
+    for nome, simulador, args in fases_do_projeto(param):
+        grafo.adicionar(nome, simulador, args, deps[nome])
+    grafo.ordem_topologica()  # valida predecessoras e ciclos já na montagem
+    return grafo
+
+
 # ==========================================================
 # 2. Rodar múltiplas simulações
 # ==========================================================
-def rodar_simulacoes(param, contrato, N=10000, plot=False, nome_cenario="Cenário"):
+def salvar_histogramas(custos_totais, tempos_totais, nome_cenario):
+    """Gera e salva os histogramas de custos e tempos totais do cenário."""
+    pasta = os.path.join("assets", "histogramas_cenarios")
+    os.makedirs(pasta, exist_ok=True)
+
+    # Histograma de custos
+    plt.figure(figsize=(8, 4))
+    plt.hist(custos_totais, bins=60, color='#5DADE2', edgecolor='black')
+    plt.title(f"Distribuição dos Custos Totais - {nome_cenario}")
+    plt.xlabel("Custo Total (R$)")
+    plt.ylabel("Frequência")
+    plt.grid(axis='y', linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    caminho_custo = os.path.join(pasta, f"{nome_cenario.lower()}_custo.png")
+    plt.savefig(caminho_custo, dpi=300)
+    plt.close()
+
+    # Histograma de tempos
+    plt.figure(figsize=(8, 4))
+    plt.hist(tempos_totais, bins=60, color='#58D68D', edgecolor='black')
+    plt.title(f"Distribuição dos Tempos Totais - {nome_cenario}")
+    plt.xlabel("Tempo Total (dias)")
+    plt.ylabel("Frequência")
+    plt.grid(axis='y', linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    caminho_tempo = os.path.join(pasta, f"{nome_cenario.lower()}_tempo.png")
+    plt.savefig(caminho_tempo, dpi=300)
+    plt.close()
+
+    print(f"\nGráficos salvos em: {os.path.abspath(pasta)}")
+    print(f"- {os.path.basename(caminho_custo)}")
+    print(f"- {os.path.basename(caminho_tempo)}")
+
+
+def aplicar_multa(tempos, custos, contrato):
+    """Retorna (custos com multa, multas) de cada simulação, como arrays."""
+    multas = np.maximum(0, np.asarray(tempos) - contrato['prazo']) * contrato['multa_dia']
+    return np.asarray(custos) + multas, multas
+
+
+def calcular_metricas(tempos, custos_totais, multas, contrato):
+    """
+    Calcula as métricas das simulações a partir dos arrays de tempos,
+    custos com multa e multas (ver aplicar_multa).
+    """
+    N = len(custos_totais)
+    multas_atraso = multas[tempos > contrato['prazo']]
+    prejuizos = int(np.count_nonzero(custos_totais > contrato['valor_contrato']))
+
+    # Soma exata (fsum): o resultado não depende do motor nem da ordem da soma
+    return {
+        "Probabilidade de Prejuízo (%)": prejuizos / N * 100,
+        "Valor Médio da Multa (R$)": math.fsum(multas_atraso) / len(multas_atraso) if len(multas_atraso) else 0,
+        "Custo Médio Total (R$)": math.fsum(custos_totais) / N
+    }
+
+
+def rodar_simulacoes(param, contrato, N=10000, plot=False, nome_cenario="Cenário", motor="python"):
     """
     Executa N simulações e calcula as métricas:
     - Probabilidade de prejuízo
     - Valor médio de multa (entre as simulações com atraso)
     - Custo médio total (incluindo multas)
+    Com motor="compilado" as iterações rodam no núcleo fundido de
+    simulador_compilado.py, com a mesma sequência de números do motor Python.
     """
-    multas = []
-    custos_totais = []
-    tempos_totais = []
-    prejuizos = 0
-
-    for _ in range(N):
-        tempo, custo = simular_projeto(param)
-
-        # Calcula multa
-        atraso = max(0, tempo - contrato['prazo'])
-        multa = atraso * contrato['multa_dia']
-        custo_total_com_multa = custo + multa
-        
-        tempos_totais.append(tempo)
-        custos_totais.append(custo_total_com_multa)
-        
-        if custo_total_com_multa > contrato['valor_contrato']:
-            prejuizos += 1
-        if atraso > 0:
-            multas.append(multa)
-
-    prob_prejuizo = prejuizos / N * 100
-    multa_media = statistics.mean(multas) if multas else 0
-    custo_medio = statistics.mean(custos_totais)
-
-    resultados = {
-        "Probabilidade de Prejuízo (%)": prob_prejuizo,
-        "Valor Médio da Multa (R$)": multa_media,
-        "Custo Médio Total (R$)": custo_medio
-    }
+    if motor not in ("python", "compilado"):
+        raise ValueError(f"Motor desconhecido: {motor}")
+
+    if motor == "compilado":
+        tempos_totais, custos_totais, multas = simular_lote_compilado(param, contrato, N)
+    else:
+        tempos_totais, custos = np.array([simular_projeto(param) for _ in range(N)]).T
+        custos_totais, multas = aplicar_multa(tempos_totais, custos, contrato)
+
+    resultados = calcular_metricas(tempos_totais, custos_totais, multas, contrato)
 
     # ==========================================================
     # Geração e salvamento dos histogramas
     # ==========================================================
     if plot:
-        pasta = os.path.join("assets", "histogramas_cenarios")
-        os.makedirs(pasta, exist_ok=True)
-
-        # Histograma de custos
-        plt.figure(figsize=(8, 4))
-        plt.hist(custos_totais, bins=60, color='#5DADE2', edgecolor='black')
-        plt.title(f"Distribuição dos Custos Totais - {nome_cenario}")
-        plt.xlabel("Custo Total (R$)")
-        plt.ylabel("Frequência")
-        plt.grid(axis='y', linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        caminho_custo = os.path.join(pasta, f"{nome_cenario.lower()}_custo.png")
-        plt.savefig(caminho_custo, dpi=300)
-        plt.close()
-
-        # Histograma de tempos
-        plt.figure(figsize=(8, 4))
-        plt.hist(tempos_totais, bins=60, color='#58D68D', edgecolor='black')
-        plt.title(f"Distribuição dos Tempos Totais - {nome_cenario}")
-        plt.xlabel("Tempo Total (dias)")
-        plt.ylabel("Frequência")
-        plt.grid(axis='y', linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        caminho_tempo = os.path.join(pasta, f"{nome_cenario.lower()}_tempo.png")
-        plt.savefig(caminho_tempo, dpi=300)
-        plt.close()
-
-        print(f"\nGráficos salvos em: {os.path.abspath(pasta)}")
-        print(f"- {os.path.basename(caminho_custo)}")
-        print(f"- {os.path.basename(caminho_tempo)}")
+        salvar_histogramas(custos_totais, tempos_totais, nome_cenario)
 
     return resultados
 
 
+def rodar_simulacoes_grafo(param, contrato, N=10000, precedencias=None,
+                           plot=False, nome_cenario="Cenário"):
+    """
+    Executa N simulações sobre o grafo de fases (ver montar_grafo).
+    A duração do projeto é o caminho crítico, o que permite fases em paralelo.
+    Retorna (resultados, criticidade): as mesmas métricas de rodar_simulacoes
+    e a fração das simulações em que cada fase esteve no caminho crítico.
+    """
+    grafo = montar_grafo(param, precedencias)
+    tempos, custos, criticidade = grafo.simular(N)
+    custos_totais, multas = aplicar_multa(tempos, custos, contrato)
+
+    resultados = calcular_metricas(tempos, custos_totais, multas, contrato)
+
+    if plot:
+        salvar_histogramas(custos_totais, tempos, nome_cenario)
+
+    return resultados, criticidade
+
+
 # ==========================================================
 # 3. Execução para o Cenário 1 (Edifício)
 # ==========================================================
@@ -216,7 +287,7 @@ def executar_cenario_1():
         "multa_dia": 3000
     }
 
-    resultados = rodar_simulacoes(param, contrato, N=1000000, plot=True, nome_cenario="Cenário 1 - Edifício")
+    resultados = rodar_simulacoes(param, contrato, N=1000000, plot=True, nome_cenario="Cenário 1 - Edifício", motor="compilado")
     print("\n===== RESULTADOS — CENÁRIO 1 =====")
     for k, v in resultados.items():
         print(f"{k}: {v:,.2f}")
@@ -275,7 +346,7 @@ def executar_cenario_2():
         "multa_dia": 5000
     }
 
-    resultados = rodar_simulacoes(param, contrato, N=1000000, plot=True, nome_cenario="Cenário 2 - Galpão")
+    resultados = rodar_simulacoes(param, contrato, N=1000000, plot=True, nome_cenario="Cenário 2 - Galpão", motor="compilado")
     print("\n===== RESULTADOS — CENÁRIO 2 =====")
     for k, v in resultados.items():
         print(f"{k}: {v:,.2f}")
@@ -332,7 +403,7 @@ def executar_cenario_3():
         "multa_dia": 4000
     }
 
-    resultados = rodar_simulacoes(param, contrato, N=1000000, plot=True, nome_cenario="Cenário 3 - Centro de Saúde")
+    resultados = rodar_simulacoes(param, contrato, N=1000000, plot=True, nome_cenario="Cenário 3 - Centro de Saúde", motor="compilado")
     print("\n===== RESULTADOS — CENÁRIO 3 =====")
     for k, v in resultados.items():
         print(f"{k}: {v:,.2f}")
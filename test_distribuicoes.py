@@ -1,89 +1,165 @@
-import matplotlib.pyplot as plt
+# ==========================================================
+# Testes estatísticos das distribuições (headless)
+# ==========================================================
+# Compara amostras em lote dos geradores de distribuicoes.py
+# com referências analíticas (KS, qui-quadrado e momentos).
+# Executar com: python -m pytest -q test_distribuicoes.py
+# ==========================================================
+
+import math
+
 import numpy as np
+import pytest
+from scipy import stats
+
+import distribuicoes
 from distribuicoes import (
-    rand_uniform, rand_normal, rand_lognormal,
-    rand_beta, rand_pert, rand_bernoulli
+    rand_uniform, rand_bernoulli, rand_normal, rand_lognormal,
+    rand_gamma, rand_beta, rand_pert, converter_lognormal
 )
 
 # ==============================================
 # CONFIGURAÇÕES
 # ==============================================
-N = 1_000_000  # número de amostras
-bins = 50      # número de barras do histograma
+N = 20_000        # amostras por teste
+ALPHA = 1e-4      # nível de significância dos testes de aderência
+Z_MOMENTO = 5     # tolerância (em erros-padrão) para média e variância
+
+
+def amostrar(gerador, *args, n=N):
+    """Sorteia n amostras de um gerador escalar e devolve um array."""
+    return np.array([gerador(*args) for _ in range(n)])
+
+
+def verificar_ks(amostras, cdf):
+    """Teste de Kolmogorov-Smirnov contra a CDF analítica."""
+    resultado = stats.kstest(amostras, cdf)
+    assert resultado.pvalue > ALPHA, f"KS rejeitado (p={resultado.pvalue:.2e})"
+
+
+def verificar_qui_quadrado(amostras, dist, bins=20):
+    """Teste qui-quadrado em classes equiprováveis da distribuição de referência."""
+    limites = dist.ppf(np.linspace(0, 1, bins + 1))
+    observados, _ = np.histogram(amostras, bins=limites)
+    esperados = np.full(bins, len(amostras) / bins)
+    resultado = stats.chisquare(observados, esperados)
+    assert resultado.pvalue > ALPHA, f"Qui-quadrado rejeitado (p={resultado.pvalue:.2e})"
+
+
+def verificar_momentos(amostras, media, variancia):
+    """Compara média e variância amostrais com os valores analíticos."""
+    n = len(amostras)
+    erro_media = math.sqrt(variancia / n)
+    assert abs(amostras.mean() - media) < Z_MOMENTO * erro_media
+
+    # Erro-padrão da variância amostral usando o 4º momento empírico
+    m4 = np.mean((amostras - amostras.mean()) ** 4)
+    erro_var = math.sqrt(max(m4 - variancia ** 2, 0) / n)
+    assert abs(amostras.var(ddof=1) - variancia) < Z_MOMENTO * erro_var
+
+
+def verificar_distribuicao(amostras, dist):
+    """Bateria completa: KS, qui-quadrado e momentos."""
+    verificar_ks(amostras, dist.cdf)
+    verificar_qui_quadrado(amostras, dist)
+    verificar_momentos(amostras, dist.mean(), dist.var())
+
 
 # ==============================================
-# 1. UNIFORME
+# 1. UNIFORME (LCG)
 # ==============================================
-samples_custom = [rand_uniform() for _ in range(N)]
-samples_np = np.random.uniform(0, 1, N)
+def test_lcg_reproduz_sequencia():
+    gerador = distribuicoes.LCG(seed=42)
+    esperado = (1664525 * 42 + 1013904223) % 2**32
+    assert gerador.rand() == esperado / 2**32
+
 
-plt.figure(figsize=(10,4))
-plt.hist(samples_custom, bins=bins, alpha=0.6, label="Custom", color="steelblue", density=True)
-plt.hist(samples_np, bins=bins, alpha=0.5, label="Numpy", color="orange", density=True)
-plt.title("Distribuição Uniforme U(0,1)")
-plt.legend()
-plt.show()
+def test_uniforme():
+    amostras = amostrar(rand_uniform)
+    assert amostras.min() >= 0 and amostras.max() < 1
+    verificar_distribuicao(amostras, stats.uniform())
 
 
 # ==============================================
-# 2. NORMAL(0,1)
+# 2. BERNOULLI
 # ==============================================
-samples_custom = [rand_normal(0, 1) for _ in range(N)]
-samples_np = np.random.normal(0, 1, N)
+@pytest.mark.parametrize("p", [0.1, 0.3, 0.6])
+def test_bernoulli(p):
+    amostras = amostrar(rand_bernoulli, p)
+    assert set(np.unique(amostras)) <= {0, 1}
+    verificar_momentos(amostras, p, p * (1 - p))
 
-plt.figure(figsize=(10,4))
-plt.hist(samples_custom, bins=bins, alpha=0.6, label="Custom", color="steelblue", density=True)
-plt.hist(samples_np, bins=bins, alpha=0.5, label="Numpy", color="orange", density=True)
-plt.title("Distribuição Normal(0,1)")
-plt.legend()
-plt.show()
+
+# ==============================================
+# 3. NORMAL
+# ==============================================
+@pytest.mark.parametrize("mu, sigma", [(0, 1), (150000, 35000)])
+def test_normal(mu, sigma):
+    amostras = amostrar(rand_normal, mu, sigma)
+    verificar_distribuicao(amostras, stats.norm(mu, sigma))
 
 
 # ==============================================
-# 3. LOGNORMAL(0, 0.25)
+# 4. LOGNORMAL
 # ==============================================
-samples_custom = [rand_lognormal(0, 0.25) for _ in range(N)]
-samples_np = np.random.lognormal(0, 0.25, N)
+@pytest.mark.parametrize("mu, sigma", [(0, 0.25), (1, 0.8)])
+def test_lognormal(mu, sigma):
+    amostras = amostrar(rand_lognormal, mu, sigma)
+    verificar_distribuicao(amostras, stats.lognorm(s=sigma, scale=math.exp(mu)))
+
 
-plt.figure(figsize=(10,4))
-plt.hist(samples_custom, bins=bins, alpha=0.6, label="Custom", color="steelblue", density=True)
-plt.hist(samples_np, bins=bins, alpha=0.5, label="Numpy", color="orange", density=True)
-plt.title("Distribuição LogNormal(0, 0.25)")
-plt.legend()
-plt.show()
+def test_converter_lognormal_preserva_momentos():
+    media, desvio = 120000, 30000
+    mu_ln, sigma_ln = converter_lognormal(media, desvio)
+    dist = stats.lognorm(s=sigma_ln, scale=math.exp(mu_ln))
+    assert dist.mean() == pytest.approx(media)
+    assert dist.std() == pytest.approx(desvio)
 
 
 # ==============================================
-# 4. BETA(2,5)
+# 5. GAMMA (ramos k < 1 e k >= 1)
 # ==============================================
-samples_custom = [rand_beta(2, 5) for _ in range(N)]
-samples_np = np.random.beta(2, 5, N)
+@pytest.mark.parametrize("k, theta", [(0.3, 1.0), (0.8, 2.0), (1.0, 1.0), (2.5, 1.0), (9.0, 0.5)])
+def test_gamma(k, theta):
+    amostras = amostrar(rand_gamma, k, theta)
+    assert amostras.min() > 0
+    verificar_distribuicao(amostras, stats.gamma(k, scale=theta))
+
 
-plt.figure(figsize=(10,4))
-plt.hist(samples_custom, bins=bins, alpha=0.6, label="Custom", color="steelblue", density=True)
-plt.hist(samples_np, bins=bins, alpha=0.5, label="Numpy", color="orange", density=True)
-plt.title("Distribuição Beta(2,5)")
-plt.legend()
-plt.show()
+def test_gamma_k_invalido():
+    with pytest.raises(ValueError):
+        rand_gamma(0)
 
 
 # ==============================================
-# 5. PERT(10,14,20)
+# 6. BETA
 # ==============================================
-# A versão PERT não existe no NumPy, mas podemos gerar uma equivalente:
-# Beta transformada para [o,p]
-def pert_numpy(o, m, p, lambd=4):
-    alpha = 1 + lambd * (m - o) / (p - o)
-    beta = 1 + lambd * (p - m) / (p - o)
-    x = np.random.beta(alpha, beta, N)
-    return o + (p - o) * x
+@pytest.mark.parametrize("a, b", [(2, 5), (0.5, 0.5), (0.7, 3.0), (4.2, 1.8)])
+def test_beta(a, b):
+    amostras = amostrar(rand_beta, a, b)
+    assert amostras.min() >= 0 and amostras.max() <= 1
+    verificar_distribuicao(amostras, stats.beta(a, b))
+
+
+# ==============================================
+# 7. PERT
+# ==============================================
+def pert_scipy(o, m, p):
+    """PERT(o, m, p) como Beta transformada para [o, p] (λ = 4)."""
+    a = 1 + 4 * (m - o) / (p - o)
+    b = 1 + 4 * (p - m) / (p - o)
+    return stats.beta(a, b, loc=o, scale=p - o)
+
+
+@pytest.mark.parametrize("o, m, p", [(10, 14, 20), (80, 110, 150), (9, 12, 15)])
+def test_pert(o, m, p):
+    amostras = amostrar(rand_pert, o, m, p)
+    assert amostras.min() >= o and amostras.max() <= p
+    dist = pert_scipy(o, m, p)
+    assert dist.mean() == pytest.approx((o + 4 * m + p) / 6)
+    verificar_distribuicao(amostras, dist)
 
-samples_custom = [rand_pert(10, 14, 20) for _ in range(N)]
-samples_np = pert_numpy(10, 14, 20)
 
-plt.figure(figsize=(10,4))
-plt.hist(samples_custom, bins=bins, alpha=0.6, label="Custom", color="steelblue", density=True)
-plt.hist(samples_np, bins=bins, alpha=0.5, label="Numpy-equivalente", color="orange", density=True)
-plt.title("Distribuição PERT(10,14,20)")
-plt.legend()
-plt.show()
+def test_pert_parametros_invalidos():
+    with pytest.raises(ValueError):
+        rand_pert(10, 10, 20)
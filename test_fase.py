@@ -1,5 +1,86 @@
-from fases import simular_preparacao
+# ==========================================================
+# Testes das fases: médias amostrais x médias analíticas
+# ==========================================================
+# Executar com: python -m pytest -q test_fase.py
+# ==========================================================
 
-for _ in range(5):
-    tempo, custo = simular_preparacao(10, 14, 20, 120000, 30000, 150000, 35000)
-    print(f"Tempo: {tempo:.2f} dias | Custo: R${custo:,.2f}")
+import math
+
+import numpy as np
+
+from fases import (
+    simular_preparacao, simular_fundacao, simular_laje,
+    simular_alvenaria, simular_acabamento, simular_pintura
+)
+
+N = 20_000        # simulações por fase
+Z_MOMENTO = 5     # tolerância (em erros-padrão) para as médias
+
+
+def media_pert(o, m, p):
+    """Média analítica da PERT(o, m, p) com λ = 4."""
+    return (o + 4 * m + p) / 6
+
+
+def verificar_medias(simulador, args, media_T, media_C):
+    """Sorteia N execuções da fase e compara tempo e custo médios."""
+    amostras = np.array([simulador(*args) for _ in range(N)])
+    for coluna, media in zip(amostras.T, (media_T, media_C)):
+        erro = coluna.std(ddof=1) / math.sqrt(N)
+        assert abs(coluna.mean() - media) < Z_MOMENTO * erro
+
+
+def test_preparacao():
+    args = (10, 14, 20, 120000, 30000, 150000, 35000)
+    verificar_medias(simular_preparacao, args, media_pert(10, 14, 20), 120000 + 150000)
+
+
+def test_fundacao():
+    A = ((30, 40, 55), (2700000, 300000, 2300000, 250000))
+    B = ((25, 34, 48), (3000000, 350000, 2100000, 260000))
+    pA, pG, Tgeo, Cgeo = 0.6, 0.18, 25, 700000
+    args = (*A[0], *A[1], *B[0], *B[1], pA, pG, Tgeo, Cgeo)
+
+    media_T = pA * media_pert(*A[0]) + (1 - pA) * media_pert(*B[0]) + pG * Tgeo
+    media_C = (pA * (A[1][0] + A[1][2]) + (1 - pA) * (B[1][0] + B[1][2])
+               + pG * Cgeo)
+    verificar_medias(simular_fundacao, args, media_T, media_C)
+
+
+def test_laje():
+    args = (80, 100, 130, 2400000, 300000, 1800000, 200000)
+    verificar_medias(simular_laje, args, media_pert(80, 100, 130), 2400000 + 1800000)
+
+
+def test_alvenaria():
+    pR, Cret, Tret = 0.12, 300000, 12
+    args = (60, 75, 95, 900000, 120000, 1600000, 200000, pR, Cret, Tret)
+    verificar_medias(
+        simular_alvenaria, args,
+        media_pert(60, 75, 95) + pR * Tret,
+        900000 + 1600000 + pR * Cret
+    )
+
+
+def test_acabamento():
+    args = (80, 110, 150, 2500000, 350000, 2500000, 400000)
+    verificar_medias(simular_acabamento, args, media_pert(80, 110, 150), 2500000 + 2500000)
+
+
+def test_pintura():
+    pEP, pW = 0.6, 0.2
+    custosA, bomA, chuvaA = (150000, 25000, 120000, 20000), (12, 15, 20), (15, 20, 25)
+    custosB, bomB, chuvaB = (160000, 26000, 110000, 18000), (10, 14, 18), (14, 18, 24)
+    args = (pEP, pW, *custosA, *bomA, *chuvaA, *custosB, *bomB, *chuvaB)
+
+    media_A = pW * media_pert(*chuvaA) + (1 - pW) * media_pert(*bomA)
+    media_B = pW * media_pert(*chuvaB) + (1 - pW) * media_pert(*bomB)
+    media_T = pEP * media_A + (1 - pEP) * media_B
+    media_C = (pEP * (custosA[0] + custosA[2]) + (1 - pEP) * (custosB[0] + custosB[2]))
+    verificar_medias(simular_pintura, args, media_T, media_C)
+
+
+if __name__ == "__main__":
+    for _ in range(5):
+        tempo, custo = simular_preparacao(10, 14, 20, 120000, 30000, 150000, 35000)
+        print(f"Tempo: {tempo:.2f} dias | Custo: R${custo:,.2f}")
@@ -0,0 +1,152 @@
+# ==========================================================
+# Testes do grafo de fases e do caminho crítico
+# ==========================================================
+# Executar com: python -m pytest -q test_grafo.py
+# ==========================================================
+
+import numpy as np
+import pytest
+
+import distribuicoes
+from grafo import GrafoFases
+from simulator import montar_grafo, rodar_simulacoes, rodar_simulacoes_grafo, simular_projeto
+
+
+def fase_fixa(T, C=0.0):
+    """Simulador determinístico para montar grafos de teste."""
+    return T, C
+
+
+def grafo_losango():
+    """a -> (b, c) -> d"""
+    grafo = GrafoFases()
+    grafo.adicionar("a", fase_fixa)
+    grafo.adicionar("b", fase_fixa, predecessoras=["a"])
+    grafo.adicionar("c", fase_fixa, predecessoras=["a"])
+    grafo.adicionar("d", fase_fixa, predecessoras=["b", "c"])
+    return grafo
+
+
+def test_caminho_critico_losango():
+    T = np.array([
+        [1.0, 1.0, 2.0],   # a
+        [5.0, 2.0, 3.0],   # b
+        [3.0, 4.0, 3.0],   # c
+        [1.0, 1.0, 1.0],   # d
+    ])
+    duracao, criticas = grafo_losango().caminho_critico(T)
+
+    np.testing.assert_array_equal(duracao, [7.0, 6.0, 6.0])
+    np.testing.assert_array_equal(criticas, [
+        [True, True, True],
+        [True, False, True],   # empate: fica a primeira predecessora
+        [False, True, False],
+        [True, True, True],
+    ])
+
+
+def test_caminho_critico_varias_terminais():
+    grafo = GrafoFases()
+    grafo.adicionar("a", fase_fixa)
+    grafo.adicionar("b", fase_fixa, predecessoras=["a"])
+    grafo.adicionar("c", fase_fixa)
+    T = np.array([[2.0, 1.0], [2.0, 1.0], [3.0, 5.0]])
+
+    duracao, criticas = grafo.caminho_critico(T)
+    np.testing.assert_array_equal(duracao, [4.0, 5.0])
+    np.testing.assert_array_equal(criticas, [[True, False], [True, False], [False, True]])
+
+
+def test_adicionar_valida_precedencias():
+    grafo = GrafoFases()
+    grafo.adicionar("a", fase_fixa)
+    with pytest.raises(ValueError):
+        grafo.adicionar("a", fase_fixa)
+
+    grafo.adicionar("b", fase_fixa, predecessoras=["z"])
+    with pytest.raises(ValueError, match="'z'"):
+        grafo.ordem_topologica()
+
+
+def test_ciclo_rejeitado():
+    grafo = GrafoFases()
+    grafo.adicionar("a", fase_fixa)
+    grafo.adicionar("b", fase_fixa, predecessoras=["a", "c"])
+    grafo.adicionar("c", fase_fixa, predecessoras=["b"])
+    with pytest.raises(ValueError, match="ciclo"):
+        grafo.caminho_critico(np.ones((3, 2)))
+
+
+def test_predecessora_inserida_depois():
+    # c -> a -> b, mas inserido na ordem a, b, c
+    grafo = GrafoFases()
+    grafo.adicionar("a", fase_fixa, predecessoras=["c"])
+    grafo.adicionar("b", fase_fixa, predecessoras=["a"])
+    grafo.adicionar("c", fase_fixa)
+    assert grafo.ordem_topologica()[0] == [2, 0, 1]
+
+    T = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    duracao, criticas = grafo.caminho_critico(T)
+    np.testing.assert_array_equal(duracao, [9.0, 12.0])
+    assert criticas.all()
+
+
+def test_grafo_sequencial_reproduz_simular_projeto(param):
+    N = 200
+    esperado = np.array([simular_projeto(param) for _ in range(N)])
+
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    tempos, custos, criticidade = montar_grafo(param).simular(N)
+
+    np.testing.assert_array_equal(tempos, esperado[:, 0])
+    np.testing.assert_array_equal(custos, esperado[:, 1])
+    assert all(indice == 1.0 for indice in criticidade.values())
+
+
+def test_grafo_sequencial_mesmas_metricas(param, contrato):
+    N = 2000
+    esperado = rodar_simulacoes(param, contrato, N=N)
+
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    resultados, _ = rodar_simulacoes_grafo(param, contrato, N=N)
+    assert resultados == esperado
+
+
+def test_fases_em_paralelo(param, contrato):
+    precedencias = {"pintura": ("alvenaria",)}
+    N = 2000
+    grafo = montar_grafo(param, precedencias)
+    T, _ = grafo.amostrar(N)
+    duracao, criticas = grafo.caminho_critico(T)
+
+    acab, pintura = grafo.nomes.index("acab"), grafo.nomes.index("pintura")
+    np.testing.assert_allclose(duracao, T[:acab].sum(axis=0) + np.maximum(T[acab], T[pintura]))
+    np.testing.assert_array_equal(criticas[acab] ^ criticas[pintura], np.ones(N, dtype=bool))
+
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    resultados, criticidade = rodar_simulacoes_grafo(param, contrato, N=N, precedencias=precedencias)
+    assert criticidade["acab"] + criticidade["pintura"] == pytest.approx(1.0)
+    assert criticidade["acab"] > criticidade["pintura"]
+    assert 0 <= resultados["Probabilidade de Prejuízo (%)"] <= 100
+
+
+def test_precedencia_reordenada(param):
+    # Pintura logo após a alvenaria e acabamento depois da pintura
+    precedencias = {"pintura": ("alvenaria",), "acab": ("pintura",)}
+    N = 500
+    esperado = np.array([simular_projeto(param) for _ in range(N)])
+
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    grafo = montar_grafo(param, precedencias)
+    T, C = grafo.amostrar(N)
+    tempos, criticas = grafo.caminho_critico(T)
+
+    # Mesma sequência de sorteios; ainda em série, só em outra ordem
+    np.testing.assert_allclose(tempos, esperado[:, 0])
+    np.testing.assert_allclose(C.sum(axis=0), esperado[:, 1])
+    assert criticas.all()
+
+
+def test_precedencia_de_fase_desconhecida(param):
+    with pytest.raises(ValueError, match="pinturas"):
+        montar_grafo(param, {"pinturas": ("alvenaria",)})
@@ -0,0 +1,125 @@
+# ==========================================================
+# Testes da análise de sensibilidade (Sobol e tornado)
+# ==========================================================
+# Executar com: python -m pytest -q test_sensibilidade.py
+# ==========================================================
+
+import math
+
+import numpy as np
+import pytest
+
+import fases
+from sensibilidade import (
+    grupos_de_entrada, sortear_entradas, avaliar_modelo, modelos_do_projeto,
+    indices_sobol, faixas_tornado, analisar_sensibilidade
+)
+from simulator import fases_do_projeto, montar_grafo, simular_projeto
+
+
+def amostras_uniformes(N, semente):
+    rng = np.random.default_rng(semente)
+    return {"x1": {"x": rng.random(N)}, "x2": {"x": rng.random(N)}, "x3": {"x": rng.random(N)}}
+
+
+def test_sobol_modelo_analitico():
+    # y = x1 + 2 x2 + x1 x3, x ~ U(0,1): índices conhecidos analiticamente
+    def modelo(x):
+        x1, x2, x3 = x["x1"]["x"], x["x2"]["x"], x["x3"]["x"]
+        return {"y": x1 + 2 * x2 + x1 * x3}
+
+    N = 100_000
+    indices = indices_sobol(amostras_uniformes(N, 1), amostras_uniformes(N, 2), modelo)["y"]
+
+    # Var(y) = 9/16 + 4/12 + 1/144; Var(E[y|x1]) = 9/48; Var(E[y|x3]) = 1/48
+    V = 9 / 48 + 4 / 12 + 1 / 48 + 1 / 144
+    assert indices["x1"]["S1"] == pytest.approx((9 / 48) / V, abs=0.02)
+    assert indices["x2"]["S1"] == pytest.approx((4 / 12) / V, abs=0.02)
+    assert indices["x3"]["S1"] == pytest.approx((1 / 48) / V, abs=0.02)
+    assert indices["x1"]["ST"] == pytest.approx((9 / 48 + 1 / 144) / V, abs=0.02)
+    assert indices["x3"]["ST"] == pytest.approx((1 / 48 + 1 / 144) / V, abs=0.02)
+
+
+def test_custo_linear_no_numero_de_grupos():
+    chamadas = []
+
+    def modelo(x):
+        chamadas.append(1)
+        return {"y": x["x1"]["x"] + x["x2"]["x"]}
+
+    A, B = amostras_uniformes(100, 1), amostras_uniformes(100, 2)
+    indices_sobol(A, B, modelo)
+    assert len(chamadas) == len(A) + 2
+
+
+def test_modelo_vetorizado_reproduz_medias(param, contrato):
+    N = 4000
+    grafo = montar_grafo(param)
+    modelos = modelos_do_projeto(param)
+    x = sortear_entradas(grupos_de_entrada(modelos), N)
+    saidas = avaliar_modelo(x, modelos, contrato, grafo)
+
+    tempos, custos = np.array([simular_projeto(param) for _ in range(N)]).T
+    multas = np.maximum(0, saidas["tempo"] - contrato['prazo']) * contrato['multa_dia']
+
+    for obtido, esperado in ((saidas["tempo"], tempos), (saidas["custo"] - multas, custos)):
+        erro = np.hypot(obtido.std(), esperado.std()) / np.sqrt(N)
+        assert abs(obtido.mean() - esperado.mean()) < 5 * erro
+    assert set(np.unique(saidas["prejuizo"])) <= {0.0, 1.0}
+
+
+@pytest.mark.parametrize("evento", [0, 1])
+def test_modelos_seguem_simuladores_das_fases(param, monkeypatch, evento):
+    # Com geradores determinísticos e todos os eventos em `evento`, cada
+    # modelo em lote deve compor exatamente o (T, C) de simular_<fase>
+    monkeypatch.setattr(fases, "rand_pert", lambda o, m, p: (o + 4 * m + p) / 6)
+    monkeypatch.setattr(fases, "rand_lognormal", lambda mu, sigma: math.exp(mu + sigma))
+    monkeypatch.setattr(fases, "rand_normal", lambda mu, sigma: mu + sigma / 3)
+    monkeypatch.setattr(fases, "rand_bernoulli", lambda p: evento)
+
+    for nome, simulador, args in fases_do_projeto(param):
+        fatores, compor = fases.MODELOS[simulador](*args)
+        x = {fator: gerador(*a) for fator, (_, gerador, a) in fatores.items()}
+        assert compor(x) == simulador(*args), nome
+
+
+def test_grupos_declarados_nas_fases(param):
+    grupos = grupos_de_entrada(modelos_do_projeto(param))
+    assert set(grupos["fundacao.T"]) == {"TA", "TB"}
+    assert set(grupos["pintura.T"]) == {"TA_bom", "TA_chuva", "TB_bom", "TB_chuva"}
+    assert set(grupos["pintura.C"]) == {"CA", "CB"}
+    for evento in ("fundacao.pA", "fundacao.pG", "alvenaria.pR", "pintura.pEP", "pintura.pW"):
+        assert len(grupos[evento]) == 1
+
+
+def test_analise_do_projeto(param, contrato):
+    resultado = analisar_sensibilidade(param, contrato, N=2000)
+    grupos = grupos_de_entrada(modelos_do_projeto(param))
+
+    for saida in ("prejuizo", "custo", "tempo"):
+        assert set(resultado["sobol"][saida]) == set(grupos)
+        assert len(resultado["tornado"][saida]) == len(grupos)
+        amplitudes = [abs(alto - baixo) for _, baixo, alto in resultado["tornado"][saida]]
+        assert amplitudes == sorted(amplitudes, reverse=True)
+
+    # Custos de material/mão de obra não afetam o tempo
+    tempo = resultado["sobol"]["tempo"]
+    assert tempo["laje.C"]["ST"] == 0
+    assert tempo["acab.T"]["ST"] > tempo["prep.T"]["ST"]
+
+    # Evento geológico encarece a obra
+    faixas = {g: (baixo, alto) for g, baixo, alto in resultado["tornado"]["custo"]}
+    baixo, alto = faixas["fundacao.pG"]
+    assert alto - baixo == pytest.approx(param['fundacao']['Cgeo'], rel=0.1)
+
+
+def test_tornado_fixa_eventos_em_zero_e_um():
+    A = {"evento": {"E": np.array([0, 1, 0, 0])}, "x": {"x": np.array([1.0, 2.0, 3.0, 4.0])}}
+
+    def modelo(x):
+        return {"y": x["evento"]["E"] * 10 + x["x"]["x"]}
+
+    base, faixas = faixas_tornado(A, modelo)
+    assert base["y"] == pytest.approx(5.0)
+    grupo, baixo, alto = faixas["y"][0]
+    assert (grupo, baixo, alto) == ("evento", 2.5, 12.5)
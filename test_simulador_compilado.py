@@ -0,0 +1,67 @@
+# ==========================================================
+# Testes do núcleo compilado: mesma sequência do motor Python
+# ==========================================================
+# Executar com: python -m pytest -q test_simulador_compilado.py
+# ==========================================================
+
+import importlib.util
+import sys
+
+import numpy as np
+import pytest
+
+import distribuicoes
+import simulador_compilado
+from simulator import rodar_simulacoes, simular_projeto
+
+N = 3000
+
+
+def referencia_python(param, contrato, n=N):
+    """Executa o motor puro e devolve (tempos, custos com multa, estado final do LCG)."""
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    tempos, custos = np.array([simular_projeto(param) for _ in range(n)]).T
+    custos = custos + np.maximum(0, tempos - contrato['prazo']) * contrato['multa_dia']
+    return tempos, custos, distribuicoes.lcg.X
+
+
+def verificar_identico(modulo, param, contrato):
+    tempos_ref, custos_ref, X_ref = referencia_python(param, contrato)
+
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    tempos, custos, _ = modulo.simular_lote_compilado(param, contrato, N)
+
+    np.testing.assert_array_equal(tempos, tempos_ref)
+    np.testing.assert_array_equal(custos, custos_ref)
+    assert distribuicoes.lcg.X == X_ref
+
+
+def test_mesma_sequencia_do_motor_python(param, contrato):
+    verificar_identico(simulador_compilado, param, contrato)
+
+
+def test_sem_numba_usa_python_puro(monkeypatch, param, contrato):
+    monkeypatch.setitem(sys.modules, "numba", None)
+    spec = importlib.util.find_spec("simulador_compilado")
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+
+    assert not modulo.NUMBA_DISPONIVEL
+    verificar_identico(modulo, param, contrato)
+
+
+def test_rodar_simulacoes_motores_equivalentes(param, contrato):
+    esperado = rodar_simulacoes(param, contrato, N=N)
+    distribuicoes.lcg.X = distribuicoes.seed_static
+    assert rodar_simulacoes(param, contrato, N=N, motor="compilado") == esperado
+
+
+def test_motor_desconhecido(param, contrato):
+    with pytest.raises(ValueError):
+        rodar_simulacoes(param, contrato, N=1, motor="gpu")
+
+
+def test_compilar_parametros_valida_pert(param, contrato):
+    param["laje"]["m"] = param["laje"]["p"]
+    with pytest.raises(ValueError):
+        simulador_compilado.compilar_parametros(param, contrato)